@@ -1,5 +1,4 @@
-from .recog_lib import Recognition
+from .recog_lib import TextRecognitionResult, TextRecognizer
 
 
-__all__ = [Recognition, ]
-
+__all__ = ['TextRecognizer', 'TextRecognitionResult', ]
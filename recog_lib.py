@@ -1,47 +1,305 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import io
+import asyncio
+import hashlib
+import json
+import math
+import os
 import re
+import sqlite3
+import threading
+import warnings
 from abc import abstractmethod
+from collections import OrderedDict
 from collections.abc import Iterable
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import (
     Any,
+    Callable,
+    Dict,
+    Iterator,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Tuple,
     Union,
     overload,
 )
+from urllib.parse import unquote, urlparse
 
 import numpy as np
 import objc
 import Quartz
-from PIL import Image
 
 import Cocoa
 import Vision
 
 
-@dataclass(frozen=True)
-class TextRecognitionResult:
+_CYRILLIC_RE = re.compile(r'[\u0400-\u04FF]')
+
+_OUTPUT_FIELDS = frozenset({'text', 'coord', 'confidence'})
+
+# Below this many pixels the Neural Engine/GPU setup costs more than CPU inference
+_DEFAULT_CPU_PIXEL_THRESHOLD = 65_536
+
+
+def _cpu_pixel_threshold(value: Optional[str]) -> int:
+    """Parse a MACOCR_CPU_THRESHOLD value, keeping the default if it is unusable."""
+    if value is None:
+        return _DEFAULT_CPU_PIXEL_THRESHOLD
+
+    try:
+        threshold = int(value)
+    except ValueError:
+        threshold = -1
+
+    if threshold < 0:
+        warnings.warn(
+            f'Ignoring MACOCR_CPU_THRESHOLD={value!r}, expected a non-negative pixel count; '
+            f'using {_DEFAULT_CPU_PIXEL_THRESHOLD}',
+            RuntimeWarning,
+        )
+        return _DEFAULT_CPU_PIXEL_THRESHOLD
+
+    return threshold
+
+
+_CPU_PIXEL_THRESHOLD = _cpu_pixel_threshold(os.environ.get('MACOCR_CPU_THRESHOLD'))
+
+_OCR_CACHE_SIZE = 200
+_OCR_CACHE: OrderedDict[bytes, List[TextRecognitionResult]] = OrderedDict()
+_OCR_CACHE_LOCK = threading.Lock()
+
+_DISK_CACHE_FILE = 'macocr_cache.sqlite3'
+
+# One connection per cache directory, shared by every recognizer in the process
+_DISK_CACHES: Dict[str, sqlite3.Connection] = {}
+_DISK_CACHE_LOCK = threading.Lock()
+
+
+def _cache_lookup(key: bytes) -> Optional[List[TextRecognitionResult]]:
+    """Return a copy of cached results for key, marking them recently used."""
+    with _OCR_CACHE_LOCK:
+        results = _OCR_CACHE.get(key)
+        if results is None:
+            return None
+
+        _OCR_CACHE.move_to_end(key)
+        return list(results)
+
+
+def _cache_store(key: bytes, results: List[TextRecognitionResult]) -> None:
+    """Cache results for key, evicting the least recently used entries."""
+    with _OCR_CACHE_LOCK:
+        _OCR_CACHE[key] = list(results)
+        _OCR_CACHE.move_to_end(key)
+
+        while len(_OCR_CACHE) > _OCR_CACHE_SIZE:
+            _OCR_CACHE.popitem(last=False)
+
+
+# Decoded images are full resolution, so only the latest couple are kept alive
+@lru_cache(maxsize=2)
+def _decode_file(path: str, mtime_ns: int) -> Optional[Quartz.CGImageRef]:
+    """Decode image file once per (path, mtime); modifying the file invalidates it."""
+    source = Quartz.CGImageSourceCreateWithURL(Cocoa.NSURL.fileURLWithPath_(path), None)
+    return Quartz.CGImageSourceCreateImageAtIndex(source, 0, None) if source is not None else None
+
+
+def _local_path(path: str) -> str:
+    """Turn file:// URLs into filesystem paths, leaving plain paths untouched."""
+    parsed = urlparse(path)
+    if parsed.scheme != 'file':
+        return path
+
+    return unquote(parsed.path)
+
+
+@lru_cache(maxsize=1024)
+def _file_digest(path: str, mtime_ns: int, size: int) -> bytes:
+    """Hash file content; unchanged (path, mtime, size) triples skip re-reading it."""
+    with open(path, 'rb') as file:
+        return hashlib.blake2b(file.read(), digest_size=16).digest()
+
+
+def _disk_cache(cache_dir: str) -> sqlite3.Connection:
+    """Get the connection to the result cache in cache_dir, opening it on first use.
+
+    Callers must hold _DISK_CACHE_LOCK, which serializes every use of the
+    connection across threads.
+    """
+    cache_dir = os.path.abspath(cache_dir)
+    connection = _DISK_CACHES.get(cache_dir)
+
+    if connection is None:
+        os.makedirs(cache_dir, exist_ok=True)
+        connection = sqlite3.connect(
+            os.path.join(cache_dir, _DISK_CACHE_FILE),
+            check_same_thread=False,
+        )
+        connection.execute('CREATE TABLE IF NOT EXISTS ocr_results (key BLOB PRIMARY KEY, results TEXT)')
+        _DISK_CACHES[cache_dir] = connection
+
+    return connection
+
+
+def _disk_cache_lookup(cache_dir: str, key: bytes) -> Optional[List[TextRecognitionResult]]:
+    """Load results persisted for key; an unreadable cache counts as a miss."""
+    try:
+        with _DISK_CACHE_LOCK:
+            row = _disk_cache(cache_dir).execute(
+                'SELECT results FROM ocr_results WHERE key = ?', (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return [
+            TextRecognitionResult(text, confidence, tuple(box) if box is not None else None)
+            for text, confidence, box in json.loads(row[0])
+        ]
+
+    except (sqlite3.Error, OSError, ValueError, TypeError) as e:
+        warnings.warn(f'Ignoring unreadable OCR cache in {cache_dir}: {e}', RuntimeWarning)
+        return None
+
+
+def _disk_cache_store(cache_dir: str, key: bytes, results: List[TextRecognitionResult]) -> None:
+    """Persist results for key as plain JSON; a failed write only skips caching."""
+    payload = json.dumps([[result.text, result.confidence, result.bounding_box] for result in results])
+
+    try:
+        with _DISK_CACHE_LOCK:
+            connection = _disk_cache(cache_dir)
+            with connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO ocr_results (key, results) VALUES (?, ?)',
+                    (key, payload),
+                )
+
+    except (sqlite3.Error, OSError) as e:
+        warnings.warn(f'Could not write OCR cache in {cache_dir}: {e}', RuntimeWarning)
+
+
+def _disk_cache_clear(cache_dir: str) -> None:
+    """Delete the results persisted in cache_dir, if a cache exists there."""
+    with _DISK_CACHE_LOCK:
+        if (
+            os.path.abspath(cache_dir) not in _DISK_CACHES
+            and not os.path.isfile(os.path.join(cache_dir, _DISK_CACHE_FILE))
+        ):
+            return
+
+        try:
+            connection = _disk_cache(cache_dir)
+            with connection:
+                connection.execute('DELETE FROM ocr_results')
+
+        except (sqlite3.Error, OSError) as e:
+            warnings.warn(f'Could not clear OCR cache in {cache_dir}: {e}', RuntimeWarning)
+
+
+@lru_cache(maxsize=1)
+def _supported_languages() -> Tuple[str, ...]:
+    """Query Vision once for the languages it can recognize; failures are not cached."""
+    langs, err = Vision.VNRecognizeTextRequest.alloc().init().supportedRecognitionLanguagesAndReturnError_(None)
+    if langs is None:
+        raise RuntimeError(f'Failed to query supported recognition languages: {err}')
+
+    return tuple(langs)
+
+
+def _image_pixels(cg_image: Quartz.CGImageRef) -> np.ndarray:
+    """View decoded CGImage pixel rows as a (height, bytes per row) uint8 array."""
+    height = Quartz.CGImageGetHeight(cg_image)
+    bytes_per_row = Quartz.CGImageGetBytesPerRow(cg_image)
+    data = Quartz.CGDataProviderCopyData(Quartz.CGImageGetDataProvider(cg_image))
+    return np.frombuffer(data, dtype=np.uint8, count=height * bytes_per_row).reshape(height, bytes_per_row)
+
+
+def _tile_digest(pixels: np.ndarray, tile: Tuple[int, int, int, int], bits_per_pixel: int) -> bytes:
+    """Hash the whole bytes covering a pixel tile of _image_pixels rows.
+
+    Sub-byte formats (e.g. 1-bit scans) share edge bytes with neighbouring
+    pixels, so the tile's bit offset into its first byte is part of the key.
+    """
+    x, y, w, h = tile
+    start_bit = x * bits_per_pixel
+    end_byte = ((x + w) * bits_per_pixel + 7) // 8
+
+    digest = hashlib.blake2b(np.ascontiguousarray(pixels[y:y + h, start_bit // 8:end_byte]), digest_size=16).digest()
+    return digest + repr((w, h, bits_per_pixel, start_bit % 8)).encode()
+
+
+def _scale_bounding_boxes(
+    bboxes: List[Any],
+    image_size: Tuple[int, int],
+) -> List[Tuple[float, float, float, float]]:
+    """Convert normalized Vision rects to pixel boxes in a single vectorized pass."""
+    width, height = image_size
+    boxes = np.fromiter(
+        (
+            value
+            for bbox in bboxes
+            for value in (bbox.origin.x, bbox.origin.y, bbox.size.width, bbox.size.height)
+        ),
+        dtype=np.float64,
+        count=4 * len(bboxes),
+    ).reshape(-1, 4)
+
+    # Convert normalized coordinates to pixel coordinates
+    # using formula instead of VNImageRectForNormalizedRect function
+    boxes *= (width, height, width, height)
+    boxes[:, 1] = height - boxes[:, 1]  # Flip Y-axis
+
+    return [tuple(box) for box in boxes.tolist()]
+
+
+class TextRecognitionResult(NamedTuple):
     """Container for text recognition results with immutable properties."""
     text: str | None
     confidence: float | None
     bounding_box: Tuple[float, float, float, float] | None  # (x, y, width, height)
 
-    def __repr__(self) -> str:
 
-        return (
-            f'TextRecognitionResult(text={self.text!r}, '
-            f'confidence={self.confidence if self.confidence is not None else None}, '
-            f'bounding_box={self.bounding_box})'
+def _parse_output_format(output_format: Union[str, Iterable[str]]) -> frozenset:
+    """Turn 'all', a '+'-joined output format or an iterable of parts into the requested fields."""
+    try:
+        parts = frozenset(output_format.split('+') if isinstance(output_format, str) else output_format)
+    except TypeError:  # not iterable, or unhashable parts
+        parts = frozenset()
+
+    if parts == {'all'}:
+        return _OUTPUT_FIELDS
+
+    if not parts or not parts <= _OUTPUT_FIELDS:
+        raise ValueError(
+            "Output format must be 'all', or '+'-joined or iterable parts of: 'text', 'coord', 'confidence'"
         )
 
-    def __getattr__(self, item):
-        return getattr(eval(f'self.{item}()'), item)
+    return parts
+
+
+def _offset_results(
+    results: List[TextRecognitionResult],
+    x: float,
+    y: float,
+) -> List[TextRecognitionResult]:
+    """Shift tile-relative bounding boxes by the tile's top-left pixel offset."""
+    return [
+        result._replace(bounding_box=(
+            result.bounding_box[0] + x,
+            result.bounding_box[1] + y,
+            result.bounding_box[2],
+            result.bounding_box[3],
+        ))
+        if result.bounding_box is not None else result
+        for result in results
+    ]
 
 
 class TextRecognizer:
@@ -63,11 +321,29 @@ class TextRecognizer:
         'down-mirrored': Quartz.kCGImagePropertyOrientationDownMirrored,
     }
 
+    # (channels, color order) -> (color space factory, bitmap info) for raw uint8 arrays
+    _ARRAY_LAYOUTS = {
+        (1, 'rgb'): (Quartz.CGColorSpaceCreateDeviceGray, Quartz.kCGImageAlphaNone),
+        (1, 'bgr'): (Quartz.CGColorSpaceCreateDeviceGray, Quartz.kCGImageAlphaNone),
+        (3, 'rgb'): (Quartz.CGColorSpaceCreateDeviceRGB, Quartz.kCGImageAlphaNone),
+        (4, 'rgb'): (Quartz.CGColorSpaceCreateDeviceRGB, Quartz.kCGImageAlphaLast),
+        (4, 'bgr'): (
+            Quartz.CGColorSpaceCreateDeviceRGB,
+            Quartz.kCGImageAlphaFirst | Quartz.kCGBitmapByteOrder32Little,
+        ),
+    }
+
     _RECOGNITION_LEVELS = {
         0: Vision.VNRequestTextRecognitionLevelAccurate,
         1: Vision.VNRequestTextRecognitionLevelFast,
     }
 
+    # Configured requests keep Vision's model loaded, so idle ones are pooled and
+    # reused across instances; results() lives on the request, so each is lent
+    # to one caller at a time and concurrent callers get requests of their own
+    _request_pool: Dict[tuple, List[Vision.VNRecognizeTextRequest]] = {}
+    _request_pool_lock = threading.Lock()
+
     def __repr__(self):
         return (f'<{TextRecognizer.__name__} class with specified language {*self.languages,} '
                 f'and СPU status {self.use_cpu_only!r}>')
@@ -77,21 +353,63 @@ class TextRecognizer:
         *,
         languages: Union[str, List[str]] = 'en-US',
         recognition_level: Literal[0, 1] = 0,
-        use_cpu_only: bool = False,
-        default_orientation: str
+        use_cpu_only: Optional[bool] = None,
+        default_orientation: str,
+        region_of_interest: Optional[Tuple[float, float, float, float]] = None,
+        extra_requests: Optional[List[Vision.VNRequest]] = None,
+        color_order: Literal['rgb', 'bgr'] = 'rgb',
+        use_cache: bool = True,
+        use_language_correction: Optional[bool] = None,
+        custom_words: Optional[List[str]] = None,
+        minimum_text_height: float = 0.0,
+        max_dimension: Optional[int] = 2048,
+        cache_dir: Optional[str] = None,
     ) -> None:
         """Initialize the text recognizer with configuration options.
 
         Args:
             languages: Language(s) for text recognition (default: 'en-US')
             recognition_level: 0 for accurate, 1 for fast recognition
-            use_cpu_only: Force CPU-only processing if True
+            use_cpu_only: Force CPU-only processing if True, or GPU/Neural Engine if
+                False; by default small images (below MACOCR_CPU_THRESHOLD pixels,
+                65536) run on the CPU, where there is no accelerator setup cost
             default_orientation: Default image orientation
+            region_of_interest: Normalized (x, y, width, height) rect with a
+                lower-left origin to restrict recognition to (default: whole image);
+                the image is cropped to it, and it is ignored when explicit
+                segments are passed to recognize
+            extra_requests: Additional Vision requests (e.g. VNDetectTextRectanglesRequest)
+                performed on the same decoded image; read their results from the
+                request objects themselves. Only supported by recognize() on a
+                whole image: tiles, batches and async calls would overwrite them
+            color_order: Channel order of numpy array inputs, 'bgr' for OpenCV frames
+            use_cache: Reuse results for identical image content and settings
+            use_language_correction: Run Vision's language-model correction pass
+                (default: on for accurate, off for fast recognition)
+            custom_words: Extra vocabulary for language correction
+            minimum_text_height: Smallest text height to look for, as a fraction of
+                the image height (default: Vision's own 1/32); raising it, e.g. to
+                0.1 for headline-only OCR, lets Vision skip small-text scales
+            max_dimension: Downscale images whose longest side exceeds this many
+                pixels before recognition; None keeps full resolution
+            cache_dir: Directory for a persistent SQLite result cache shared
+                across processes (default: in-memory cache only)
         """
         self.languages = [languages] if isinstance(languages, str) else languages
         self.recognition_level = recognition_level
         self.use_cpu_only = use_cpu_only
         self.default_orientation = default_orientation
+        self.region_of_interest = region_of_interest
+        self.extra_requests = list(extra_requests or [])
+        self.color_order = color_order
+        self.use_cache = use_cache
+        self.use_language_correction = (
+            recognition_level == 0 if use_language_correction is None else use_language_correction
+        )
+        self.custom_words = list(custom_words or [])
+        self.minimum_text_height = minimum_text_height
+        self.max_dimension = max_dimension
+        self.cache_dir = cache_dir
 
         self._validate_parameters()
 
@@ -100,6 +418,10 @@ class TextRecognizer:
         if not all(isinstance(lang, str) for lang in self.languages):
             raise ValueError('All languages must be strings')
 
+        unsupported = set(self.languages).difference(_supported_languages())
+        if unsupported:
+            raise ValueError(f'Languages not supported: {sorted(unsupported)}')
+
         if self.recognition_level not in self._RECOGNITION_LEVELS:
             raise ValueError('Recognition level must be 0 (accurate) or 1 (fast)')
 
@@ -108,6 +430,32 @@ class TextRecognizer:
                 f'Invalid orientation. Must be one of: {sorted(self._ORIENTATION_MAP.keys())}'
             )
 
+        if self.region_of_interest is not None:
+            if not isinstance(self.region_of_interest, (tuple, list)) or len(self.region_of_interest) != 4:
+                raise ValueError('Region of interest must be a (x, y, width, height) tuple')
+
+            x, y, w, h = self.region_of_interest
+            if not (0 <= x and 0 <= y and w > 0 and h > 0 and x + w <= 1 and y + h <= 1):
+                raise ValueError('Region of interest must lie within the normalized (0, 0, 1, 1) rect')
+
+        if not all(isinstance(request, Vision.VNRequest) for request in self.extra_requests):
+            raise ValueError('Extra requests must be Vision VNRequest instances')
+
+        if self.extra_requests and self._crops_to_region():
+            raise ValueError('Extra requests cannot be combined with a region of interest')
+
+        if self.color_order not in ('rgb', 'bgr'):
+            raise ValueError("Color order must be 'rgb' or 'bgr'")
+
+        if not all(isinstance(word, str) for word in self.custom_words):
+            raise ValueError('All custom words must be strings')
+
+        if not 0 <= self.minimum_text_height <= 1:
+            raise ValueError('Minimum text height must be a fraction between 0 and 1')
+
+        if self.max_dimension is not None and (not isinstance(self.max_dimension, int) or self.max_dimension <= 0):
+            raise ValueError('Max dimension must be a positive integer or None')
+
     @overload
     def recognize(
         self,
@@ -115,6 +463,7 @@ class TextRecognizer:
         *,
         output_format: Literal['text'] |  Optional[Iterable[str]] = 'text',
         orientation: Optional[str] = None,
+        segments: Optional[List[Tuple[int, int, int, int]]] = None,
     ) -> Iterable[TextRecognitionResult]:
         pass
 
@@ -125,6 +474,7 @@ class TextRecognizer:
         *,
         output_format: Literal['coord'] | Optional[Iterable[str]],
         orientation: Optional[str] = None,
+        segments: Optional[List[Tuple[int, int, int, int]]] = None,
     ) -> Iterable[TextRecognitionResult]:
         pass
 
@@ -135,6 +485,7 @@ class TextRecognizer:
         *,
         output_format: Literal['confidence'] |  Optional[Iterable[str]],
         orientation: Optional[str] = None,
+        segments: Optional[List[Tuple[int, int, int, int]]] = None,
     ) -> Iterable[TextRecognitionResult]:
         pass
 
@@ -145,6 +496,7 @@ class TextRecognizer:
         *,
         output_format: Literal['all'],
         orientation: Optional[str] = None,
+        segments: Optional[List[Tuple[int, int, int, int]]] = None,
     ) -> Iterable[TextRecognitionResult]:
         pass
 
@@ -152,8 +504,9 @@ class TextRecognizer:
         self,
         image_source: Union[str, np.ndarray],
         *,
-        output_format: Literal['text', 'coord', 'confidence', 'all'] = 'text',
+        output_format: Union[str, Iterable[str]] = 'text',
         orientation: Optional[str] = None,
+        segments: Optional[List[Tuple[int, int, int, int]]] = None,
     ) -> Union[
         List[str],
         List[Tuple[float, float, float, float]],
@@ -164,9 +517,13 @@ class TextRecognizer:
 
         Args:
             image_source: Path to image file or numpy array containing image data
-            output_format: Format of returned data
-            #region_of_interest: Optional region (x, y) to restrict recognition
+            output_format: Format of returned data: 'text', 'coord', 'confidence',
+                'all', '+'-joined parts such as 'text+coord', or an iterable of parts
             orientation: Optional image orientation override
+            segments: Optional pixel (x, y, width, height) tiles with a top-left
+                origin to recognize separately; tiles whose pixels were seen
+                before are served from the cache, and bounding boxes are
+                reported in whole-image coordinates
 
         Returns:
             Recognized text data in requested format
@@ -176,122 +533,535 @@ class TextRecognizer:
             ValueError: For invalid parameters or image data
             RuntimeError: For recognition failures
         """
+        # Unknown formats fail here, before any image is decoded or recognized
+        parts = _parse_output_format(output_format)
         orientation_key = orientation or self.default_orientation
         orientation_value = self._ORIENTATION_MAP[orientation_key]
 
         try:
-            if isinstance(image_source, str):
-                handler = self._create_handler_from_file(image_source, orientation_value)
-                image_size = self._get_image_size(image_source)
-            elif isinstance(image_source, np.ndarray):
-                handler = self._create_handler_from_array(image_source, orientation_value)
-                image_size = (image_source.shape[1], image_source.shape[0])
-            else:
-                raise TypeError(
-                    'image_source must be either a file path or numpy array'
-                )
+            # Drain bridge temporaries (decoded images, observations) per call
+            with objc.autorelease_pool():
+                if segments is not None:
+                    return self._recognize_segments(image_source, segments, orientation_value, parts)
 
-            request = self._create_recognition_request()
-            self._perform_recognition(handler, request)
+                # The region of interest is part of the key, so repeat calls on an
+                # unchanged file are served without decoding or copying its pixels
+                cache_key = self._cache_key(image_source, orientation_value, parts)
+                if cache_key is not None:
+                    cached = self._lookup_results(cache_key)
+                    if cached is not None:
+                        return cached
 
-            return self._format_results(
-                request.results(),
-                output_format,
-                image_size,
-            )
+                if self._crops_to_region():
+                    # Served by cropping, so only the region's pixels are sent to Vision
+                    results = self._recognize_segments(image_source, None, orientation_value, parts)
+                else:
+                    handler, image_size = self._create_handler(image_source, orientation_value)
+
+                    with self._recognition_request(image_size) as request:
+                        self._perform_recognition(handler, request)
+
+                        results = self._format_results(
+                            request.results(),
+                            parts,
+                            image_size,
+                        )
+
+                if cache_key is not None:
+                    self._store_results(cache_key, results)
+
+                return results
 
         except objc.internal_error as e:  # noqa
             raise RuntimeError(f'Text recognition failed: {str(e)}') from e
 
-    @abstractmethod
-    def _create_handler_from_file(
+    def recognize_batch(
+        self,
+        image_sources: Iterable[Union[str, np.ndarray]],
+        *,
+        output_format: Union[str, Iterable[str]] = 'text',
+        orientation: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[List[TextRecognitionResult]]:
+        """Recognize text from several image sources in parallel.
+
+        Each worker thread loads, decodes and recognizes its image with a
+        pooled request of its own, so the Vision work runs concurrently too;
+        requests are returned to the pool and reused by later calls.
+
+        Args:
+            image_sources: Paths to image files and/or numpy arrays
+            output_format: Format of returned data: 'text', 'coord', 'confidence',
+                'all', '+'-joined parts such as 'text+coord', or an iterable of parts
+            orientation: Optional image orientation override
+            max_workers: Number of worker threads (default: CPU count)
+
+        Returns:
+            One list of results per image source, in input order
+        """
+        if self.extra_requests:
+            raise ValueError('Extra requests are only supported by recognize(), one image at a time')
+
+        parts = _parse_output_format(output_format)
+
+        def recognize_one(image_source):
+            return self.recognize(image_source, output_format=parts, orientation=orientation)
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(recognize_one, image_sources))
+
+    def recognize_async(
+        self,
+        image_source: Union[str, np.ndarray],
+        *,
+        output_format: Union[str, Iterable[str]] = 'text',
+        orientation: Optional[str] = None,
+        callback: Optional[Callable[[List[TextRecognitionResult]], None]] = None,
+    ) -> Future:
+        """Recognize text on a background dispatch queue without blocking the caller.
+
+        Args:
+            image_source: Path to image file or numpy array containing image data
+            output_format: Format of returned data: 'text', 'coord', 'confidence',
+                'all', '+'-joined parts such as 'text+coord', or an iterable of parts
+            orientation: Optional image orientation override
+            callback: Optional callable invoked with the results on the
+                dispatch queue once the future is resolved; exceptions it raises
+                are reported as RuntimeWarning
+
+        Returns:
+            Future resolved with the same value :meth:`recognize` returns
+        """
+        if self.extra_requests:
+            raise ValueError('Extra requests are only supported by recognize(), one image at a time')
+
+        parts = _parse_output_format(output_format)
+
+        # pyobjc-framework-libdispatch is only needed by the async entry points
+        import dispatch
+
+        future = Future()
+
+        def block():
+            if not future.set_running_or_notify_cancel():
+                return
+
+            try:
+                results = self.recognize(image_source, output_format=parts, orientation=orientation)
+            except Exception as e:
+                future.set_exception(e)
+                return
+
+            future.set_result(results)
+
+            # A failing callback must not discard results the future already holds
+            if callback is not None:
+                try:
+                    callback(results)
+                except Exception as e:
+                    warnings.warn(f'recognize_async callback raised {e!r}', RuntimeWarning)
+
+        dispatch.dispatch_async(
+            dispatch.dispatch_get_global_queue(dispatch.DISPATCH_QUEUE_PRIORITY_HIGH, 0),
+            block,
+        )
+
+        return future
+
+    async def gather_recognitions(
         self,
-        file_path: str,
+        image_sources: Iterable[Union[str, np.ndarray]],
+        *,
+        output_format: Union[str, Iterable[str]] = 'text',
+        orientation: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[List[TextRecognitionResult]]:
+        """Recognize several image sources concurrently from asyncio code.
+
+        Args:
+            image_sources: Paths to image files and/or numpy arrays
+            output_format: Format of returned data: 'text', 'coord', 'confidence',
+                'all', '+'-joined parts such as 'text+coord', or an iterable of parts
+            orientation: Optional image orientation override
+            max_concurrency: Most images dispatched, and so decoded and held in
+                memory, at once (default: CPU count)
+
+        Returns:
+            One list of results per image source, in input order
+        """
+        parts = _parse_output_format(output_format)
+        semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count())
+
+        async def recognize_one(image_source):
+            async with semaphore:
+                return await asyncio.wrap_future(
+                    self.recognize_async(image_source, output_format=parts, orientation=orientation)
+                )
+
+        return list(await asyncio.gather(*(recognize_one(image_source) for image_source in image_sources)))
+
+    def _create_handler(
+        self,
+        image_source: Union[str, np.ndarray],
+        orientation: int,
+    ) -> Tuple[Vision.VNImageRequestHandler, Tuple[int, int]]:
+        """Create Vision request handler and image size for any image source."""
+        cg_image = self._load_image(image_source)
+        # Vision boxes are normalized, so they map back onto the original size
+        handler = self._create_handler_from_cgimage(self._downscale(cg_image), orientation)
+        image_size = (Quartz.CGImageGetWidth(cg_image), Quartz.CGImageGetHeight(cg_image))
+
+        return handler, image_size
+
+    def _recognize_segments(
+        self,
+        image_source: Union[str, np.ndarray],
+        segments: Optional[List[Tuple[int, int, int, int]]],
         orientation: int,
-    ) -> Optional[Vision.VNImageRequestHandler]:
-        """Create Vision request handler from image file."""
+        parts: frozenset,
+    ) -> List[TextRecognitionResult]:
+        """Recognize image tiles separately, reusing results for tiles seen before.
+
+        Without explicit segments the region of interest is the only tile, and
+        recognize() caches its results under the whole image's key instead.
+        """
+        if self.extra_requests:
+            raise ValueError('Extra requests cannot be combined with segments or a region of interest')
+
+        cg_image = self._load_image(image_source)
+        image_width = Quartz.CGImageGetWidth(cg_image)
+        image_height = Quartz.CGImageGetHeight(cg_image)
+
+        # The full-frame pixel copy is only needed to hash explicit tiles for the cache
+        cache_tiles = self.use_cache and segments is not None
+
+        if segments is None:
+            segments = [self._region_rect(image_width, image_height)]
+
+        if cache_tiles:
+            bits_per_pixel = Quartz.CGImageGetBitsPerPixel(cg_image)
+            pixels = _image_pixels(cg_image)
+
+        params = self._result_params(orientation, parts)
+        results = []
+
+        for segment in segments:
+            if (
+                not isinstance(segment, (tuple, list))
+                or len(segment) != 4
+                or not all(isinstance(value, (int, np.integer)) and not isinstance(value, bool) for value in segment)
+            ):
+                raise ValueError('Segments must be (x, y, width, height) tuples of integer pixels')
+
+            x, y, w, h = segment
+            if not (0 <= x and 0 <= y and w > 0 and h > 0 and x + w <= image_width and y + h <= image_height):
+                raise ValueError(f'Segment {segment} lies outside the {image_width}x{image_height} image')
+
+            cache_key = None
+            if cache_tiles:
+                cache_key = b'segment:' + _tile_digest(pixels, segment, bits_per_pixel) + params
+
+            segment_results = self._lookup_results(cache_key) if cache_key is not None else None
+            if segment_results is None:
+                crop = Quartz.CGImageCreateWithImageInRect(cg_image, Quartz.CGRectMake(x, y, w, h))
+                handler = self._create_handler_from_cgimage(self._downscale(crop), orientation)
+                with self._recognition_request((w, h)) as request:
+                    self._perform_recognition(handler, request)
+                    segment_results = self._format_results(request.results(), parts, (w, h))
+
+                if cache_key is not None:
+                    self._store_results(cache_key, segment_results)
+
+            # Cached boxes are tile-relative so recurring tiles match anywhere
+            results.extend(_offset_results(segment_results, x, y))
+
+        return results
+
+    def _crops_to_region(self) -> bool:
+        """Whether a region of interest smaller than the whole image is set."""
+        return self.region_of_interest is not None and tuple(self.region_of_interest) != (0, 0, 1, 1)
+
+    def _region_rect(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Convert the normalized, lower-left origin ROI into a top-left pixel rect."""
+        x, y, w, h = self.region_of_interest
+
+        left = int(x * width)
+        right = min(width, math.ceil((x + w) * width))
+        top = int((1 - y - h) * height)
+        bottom = min(height, math.ceil((1 - y) * height))
+
+        return left, top, max(1, right - left), max(1, bottom - top)
+
+    def _downscale(self, cg_image: Quartz.CGImageRef) -> Quartz.CGImageRef:
+        """Shrink CGImage so its longest side fits max_dimension."""
+        width = Quartz.CGImageGetWidth(cg_image)
+        height = Quartz.CGImageGetHeight(cg_image)
+
+        if self.max_dimension is None or max(width, height) <= self.max_dimension:
+            return cg_image
+
+        scale = self.max_dimension / max(width, height)
+        scaled_width = max(1, round(width * scale))
+        scaled_height = max(1, round(height * scale))
+
+        context = Quartz.CGBitmapContextCreate(
+            None,
+            scaled_width,
+            scaled_height,
+            8,
+            0,
+            Quartz.CGColorSpaceCreateDeviceRGB(),
+            Quartz.kCGImageAlphaPremultipliedLast,
+        )
+        Quartz.CGContextSetInterpolationQuality(context, Quartz.kCGInterpolationHigh)
+        Quartz.CGContextDrawImage(context, Quartz.CGRectMake(0, 0, scaled_width, scaled_height), cg_image)
+
+        return Quartz.CGBitmapContextCreateImage(context)
+
+    def _load_image(self, image_source: Union[str, np.ndarray]) -> Quartz.CGImageRef:
+        """Decode any supported image source into a CGImage."""
+        if isinstance(image_source, str):
+            return self._load_image_from_file(image_source)
+
+        if isinstance(image_source, np.ndarray):
+            return self._load_image_from_array(image_source)
+
+        raise TypeError(
+            'image_source must be either a file path or numpy array'
+        )
+
+    def _load_image_from_file(self, file_path: str) -> Quartz.CGImageRef:
+        """Decode image file straight into a CGImage."""
         if not isinstance(file_path, str):
             raise TypeError('File path must be a string')
 
         if not file_path:
             raise ValueError('File path cannot be empty')
 
-        if re.search(r'[а-яА-Я]', file_path):
+        file_path = _local_path(file_path)
+
+        # isascii() is a flag check, so common ASCII paths skip the regex engine
+        if not file_path.isascii() and _CYRILLIC_RE.search(file_path):
             raise ValueError('File path cannot contain Cyrillic characters')
 
-        try:
-            image = Vision.NSImage.alloc().initWithContentsOfFile_(
-                Cocoa.NSString.stringWithString_(file_path)
-            ).TIFFRepresentation()
-
-            if image is None:
-                raise ValueError('Failed to load image data')
-
-            cg_image = Cocoa.NSBitmapImageRep.imageRepWithData_(image).CGImage()
-
-            return Vision.VNImageRequestHandler.alloc().initWithCGImage_orientation_options_(
-                cg_image,
-                orientation,
-                {
-                    Vision.VNImageOptionCameraIntrinsics: False,
-                    Vision.VNImageOptionProperties: True
-                },
-            )
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f'Image file not found: {file_path}')
+
+        path = os.path.abspath(file_path)
+        cg_image = _decode_file(path, os.stat(path).st_mtime_ns)
+
+        if cg_image is None:
+            raise ValueError('Failed to load image data')
 
-        except AttributeError as e:
-            raise FileNotFoundError(f'Image file not found: {file_path}') from e
+        return cg_image
 
-    def _create_handler_from_array(
+    def _create_handler_from_cgimage(
         self,
-        image_array: np.ndarray,
+        cg_image: Quartz.CGImageRef,
         orientation: int,
     ) -> Vision.VNImageRequestHandler:
-        """Create Vision request handler from numpy array."""
+        """Create Vision request handler from decoded CGImage."""
+        return Vision.VNImageRequestHandler.alloc().initWithCGImage_orientation_options_(
+            cg_image,
+            orientation,
+            {
+                Vision.VNImageOptionCameraIntrinsics: False,
+                Vision.VNImageOptionProperties: True
+            },
+        )
+
+    def _load_image_from_array(self, image_array: np.ndarray) -> Quartz.CGImageRef:
+        """Wrap raw numpy pixel data into a CGImage without re-encoding it."""
         if not isinstance(image_array, np.ndarray):
             raise TypeError('Image data must be a numpy array')
-        print(image_array.nbytes)
+
         if image_array.ndim not in (2, 3):
             raise ValueError('Image array must be 2D (grayscale) or 3D (color)')
 
-        try:
-            pil_image = Image.fromarray(image_array, mode='RGB')
-            with io.BytesIO() as buffer:
-                pil_image.save(buffer, format='PNG', save_all=True)
-                ns_data = Cocoa.NSData.dataWithBytes_length_(
-                    buffer.getvalue(), len(buffer.getvalue())
-                )
+        if image_array.dtype != np.uint8:
+            raise ValueError('Image array must have uint8 dtype')
 
-            return Vision.VNImageRequestHandler.alloc().initWithData_orientation_options_(
-                ns_data, orientation, {
-                    Vision.VNImageOptionCameraIntrinsics: False,
-                    Vision.VNImageOptionProperties: True
-                },
-            )
+        channels = 1 if image_array.ndim == 2 else image_array.shape[2]
+        color_order = self.color_order
+
+        if channels == 3 and color_order == 'bgr':
+            # CoreGraphics has no packed 24-bit BGR format, so reorder channels once
+            image_array, color_order = image_array[..., ::-1], 'rgb'
+
+        if (channels, color_order) not in self._ARRAY_LAYOUTS:
+            raise ValueError('Image array must have 1 (gray), 3 (RGB) or 4 (RGBA) channels')
+
+        color_space, bitmap_info = self._ARRAY_LAYOUTS[channels, color_order]
+        height, width = image_array.shape[:2]
+
+        # tobytes() makes the one copy of the frame, packed in C order even for
+        # strided views such as the BGR reorder above; PyObjC then hands those
+        # bytes over as an NSData proxy that references them without copying again
+        provider = Quartz.CGDataProviderCreateWithCFData(image_array.tobytes())
+        cg_image = Quartz.CGImageCreate(
+            width,
+            height,
+            8,
+            8 * channels,
+            width * channels,
+            color_space(),
+            bitmap_info,
+            provider,
+            None,
+            False,
+            Quartz.kCGRenderingIntentDefault,
+        )
+
+        if cg_image is None:
+            raise ValueError('Failed to convert numpy array to image')
+
+        return cg_image
+
+    @classmethod
+    def warm_up(cls, **options: Any) -> TextRecognizer:
+        """Load the Vision model ahead of time by recognizing a small blank image.
+
+        Args:
+            **options: TextRecognizer configuration to warm up (default_orientation
+                defaults to 'up')
+
+        Returns:
+            Recognizer sharing the warmed-up request
+        """
+        options.setdefault('default_orientation', 'up')
+        recognizer = cls(**options)
+        orientation = cls._ORIENTATION_MAP[recognizer.default_orientation]
+
+        # Runs Vision directly: a cached blank-image result would skip loading the model.
+        # 512x512 is large enough to warm the accelerator request that real images use
+        with objc.autorelease_pool():
+            handler, image_size = recognizer._create_handler(np.zeros((512, 512), dtype=np.uint8), orientation)
+            with recognizer._recognition_request(image_size) as request:
+                recognizer._perform_recognition(handler, request)
+
+        return recognizer
+
+    @classmethod
+    def clear_cache(cls, cache_dir: Optional[str] = None) -> None:
+        """Forget in-memory cached recognition results, decoded images and file hashes.
+
+        Args:
+            cache_dir: Persistent cache to empty as well; it may be shared with
+                other processes, so on-disk results are kept unless it is named
+        """
+        with _OCR_CACHE_LOCK:
+            _OCR_CACHE.clear()
+
+        _decode_file.cache_clear()
+        _file_digest.cache_clear()
+
+        if cache_dir is not None:
+            _disk_cache_clear(cache_dir)
+
+    def _cache_key(
+        self,
+        image_source: Union[str, np.ndarray],
+        orientation: int,
+        parts: frozenset,
+    ) -> Optional[bytes]:
+        """Build the content-addressed result cache key, or None if not cacheable."""
+        # Extra requests must actually run to fill in their own results
+        if not self.use_cache or self.extra_requests:
+            return None
+
+        if isinstance(image_source, str) and os.path.isfile(_local_path(image_source)):
+            path = os.path.abspath(_local_path(image_source))
+            stat = os.stat(path)
+            digest = _file_digest(path, stat.st_mtime_ns, stat.st_size)
+        elif isinstance(image_source, np.ndarray):
+            digest = hashlib.blake2b(np.ascontiguousarray(image_source), digest_size=16).digest()
+            digest += repr((image_source.shape, image_source.dtype.str)).encode()
+        else:
+            return None
+
+        region = tuple(self.region_of_interest) if self._crops_to_region() else None
+        return digest + self._result_params(orientation, parts) + repr(region).encode()
 
-        except Exception as e:
-            raise ValueError('Failed to convert numpy array to image') from e
+    def _lookup_results(self, key: bytes) -> Optional[List[TextRecognitionResult]]:
+        """Find cached results in memory, then in the on-disk cache if configured."""
+        results = _cache_lookup(key)
 
-    def _get_image_size(self, file_path: str) -> Tuple[int, int]:
-        """Get dimensions of image file."""
-        ns_image = Vision.NSImage.alloc().initWithContentsOfFile_(Cocoa.NSString.stringWithString_(file_path))
-        self.size = ns_image.size()
-        return int(self.size.width), int(self.size.height)
+        if results is None and self.cache_dir is not None:
+            results = _disk_cache_lookup(self.cache_dir, key)
+            if results is not None:
+                _cache_store(key, results)
 
-    def _create_recognition_request(self) -> Vision.VNRecognizeTextRequest:
+        return results
+
+    def _store_results(self, key: bytes, results: List[TextRecognitionResult]) -> None:
+        """Cache results in memory and, if configured, on disk."""
+        _cache_store(key, results)
+
+        if self.cache_dir is not None:
+            _disk_cache_store(self.cache_dir, key, results)
+
+    def _result_params(self, orientation: int, parts: frozenset) -> bytes:
+        """Encode every setting besides the pixels that affects cached results."""
+        params = (self._request_key(self.use_cpu_only), self.color_order, self.max_dimension, orientation, sorted(parts))
+        return repr(params).encode()
+
+    def _request_key(self, use_cpu_only: Optional[bool]) -> tuple:
+        """Key identifying the request configuration shared between instances."""
+        return (
+            tuple(self.languages),
+            self.recognition_level,
+            use_cpu_only,
+            self.use_language_correction,
+            tuple(self.custom_words),
+            self.minimum_text_height,
+        )
+
+    @contextmanager
+    def _recognition_request(self, image_size: Tuple[int, int]) -> Iterator[Vision.VNRecognizeTextRequest]:
+        """Borrow an idle configured request for an image of this size, or create one."""
+        use_cpu_only = self._uses_cpu_only(image_size)
+        key = self._request_key(use_cpu_only)
+
+        with self._request_pool_lock:
+            idle = self._request_pool.setdefault(key, [])
+            request = idle.pop() if idle else None
+
+        if request is None:
+            request = self._create_recognition_request(use_cpu_only)
+
+        try:
+            yield request
+        finally:
+            with self._request_pool_lock:
+                self._request_pool[key].append(request)
+
+    def _uses_cpu_only(self, image_size: Tuple[int, int]) -> bool:
+        """Pick CPU-only for tiny images unless the caller chose explicitly."""
+        if self.use_cpu_only is not None:
+            return self.use_cpu_only
+
+        width, height = image_size
+        return width * height < _CPU_PIXEL_THRESHOLD
+
+    def _create_recognition_request(self, use_cpu_only: bool) -> Vision.VNRecognizeTextRequest:
         """Create and configure text recognition request."""
         request = Vision.VNRecognizeTextRequest.alloc().init()
         request.setRevision_(Vision.VNRecognizeTextRequestRevision3)
 
-        if not self.languages[0] in self.supported_languages:
-            raise ValueError('Languages not supported')
-
         if self.languages != ['en-US']:
             request.setRecognitionLanguages_(self.languages)
 
-        if self.use_cpu_only:
+        if use_cpu_only:
             request.setUsesCPUOnly_(True)
 
         request.setRecognitionLevel_(self._RECOGNITION_LEVELS[self.recognition_level])
+        request.setUsesLanguageCorrection_(self.use_language_correction)
+
+        if self.custom_words:
+            request.setCustomWords_(self.custom_words)
+
+        if self.minimum_text_height > 0:
+            request.setMinimumTextHeight_(self.minimum_text_height)
 
         return request
 
@@ -301,17 +1071,17 @@ class TextRecognizer:
         handler: Vision.VNImageRequestHandler,
         request: Vision.VNRecognizeTextRequest,
     ) -> None:
-        """Perform the text recognition request."""
+        """Perform the text recognition request alongside any extra requests."""
         with objc.autorelease_pool():
-            success = handler.performRequests_error_([request], None)
+            success = handler.performRequests_error_([request, *self.extra_requests], None)
             if not success:
                 raise RuntimeError('Failed to perform text recognition')
 
     @abstractmethod
     def _format_results(
         self,
-        observations: List[Any],
-        output_format: str,
+        observations: Optional[List[Any]],
+        parts: frozenset,
         image_size: Tuple[int, int],
     ) -> Union[
         List[str],
@@ -319,47 +1089,55 @@ class TextRecognizer:
         List[float],
         List[TextRecognitionResult]
     ]:
-        """Format recognition results according to requested output format."""
-        results = []
-        width, height = image_size
+        """Format recognition results for the already parsed output format parts."""
+        want_text = 'text' in parts
+        want_coord = 'coord' in parts
+        want_conf = 'confidence' in parts
+
+        # Unbound selectors are resolved once instead of per observation
+        top_candidates_of = Vision.VNRecognizedTextObservation.topCandidates_
+        bounding_box_of = Vision.VNRecognizedTextObservation.boundingBox
+        string_of = Vision.VNRecognizedText.string
+        confidence_of = Vision.VNRecognizedText.confidence
+
+        # results() is nil when Vision produced nothing for the request
+        observations = [
+            observation for observation in observations or ()
+            if isinstance(observation, Vision.VNRecognizedTextObservation)
+        ]
+        matched = []
+        candidates = []
 
         for observation in observations:
-            if not isinstance(observation, Vision.VNRecognizedTextObservation):
+            top_candidates = top_candidates_of(observation, 1)
+            if not top_candidates:
                 continue
 
-            for candidate in observation.topCandidates_(1):
-                text = candidate.string()
-                confidence = candidate.confidence()
-                bbox = observation.boundingBox()
-
-                # Convert normalized coordinates to pixel coordinates
-                # using formula instead of VNImageRectForNormalizedRect function
-                x = bbox.origin.x * width
-                y = (1 - bbox.origin.y) * height  # Flip Y-axis
-                w = bbox.size.width * width
-                h = bbox.size.height * height
-
-                if output_format == 'text':
-                    results.append(
-                        TextRecognitionResult(text=text, confidence=None, bounding_box=None))
-                elif output_format == 'coord':
-                    results.append(
-                        TextRecognitionResult(bounding_box=(x, y, w, h), confidence=None, text=None))
-                elif output_format == 'confidence':
-                    results.append(TextRecognitionResult(confidence=confidence, bounding_box=None, text=None))
-                elif output_format == 'all':
-                    results.append(
-                        TextRecognitionResult(
-                            text=text,
-                            confidence=confidence,
-                            bounding_box=(x, y, w, h),
-                        )
-                    )
+            matched.append(observation)
+            candidates.append(top_candidates[0])
 
-        return results
+        # Plain text is the common case; skip the per-field branching entirely
+        if parts == {'text'}:
+            return [TextRecognitionResult(string_of(candidate), None, None) for candidate in candidates]
+
+        if want_coord:
+            bounding_boxes = _scale_bounding_boxes(
+                [bounding_box_of(observation) for observation in matched],
+                image_size,
+            )
+        else:
+            bounding_boxes = [None] * len(candidates)
+
+        return [
+            TextRecognitionResult(
+                text=string_of(candidate) if want_text else None,
+                confidence=confidence_of(candidate) if want_conf else None,
+                bounding_box=bounding_box,
+            )
+            for candidate, bounding_box in zip(candidates, bounding_boxes)
+        ]
 
     @property
     def supported_languages(self) -> List[str]:
         """Get list of supported recognition languages."""
-        langs, err = Vision.VNRecognizeTextRequest.alloc().supportedRecognitionLanguagesAndReturnError_(None)
-        return langs
\ No newline at end of file
+        return list(_supported_languages())
\ No newline at end of file
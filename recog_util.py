@@ -1,6 +1,5 @@
 import argparse
 import os
-from recog_lib import Recognition
 
 
 def main():
@@ -9,27 +8,26 @@ def main():
     parser.add_argument('--img', type=str, required=True, help='Path to the image file')
     parser.add_argument('--lang', type=str, default='en-US', help='Language for recognition')
     parser.add_argument('--img_orientation', type=str, default='up', help='Orientation of the image (e.g., up, down)')
-    parser.add_argument('--output_format', type=str, default='text', help='Output format(e.g., text, coord, confidence)')
+    parser.add_argument('--output_format', type=str, default='text', help='Output format(e.g., text, coord, confidence, all)')
 
-    # Recognition interest should be passed as a list of tuples
     args = parser.parse_args()
 
     if os.path.exists(args.img):
+        # Imported here so --help and argument errors don't load Vision
+        from recog_lib import TextRecognizer
 
-        # Create Recognition instance
-        recognizeText = Recognition(
-            img=args.img,
-            lang=args.lang,
-            img_orientation=args.img_orientation,
-            output_format=args.output_format
-
+        # Create TextRecognizer instance
+        recognizer = TextRecognizer(
+            languages=args.lang,
+            default_orientation=args.img_orientation,
         )
 
         # Get results
-        results = recognizeText.return_results()
+        results = recognizer.recognize(args.img, output_format=args.output_format)
         print(results)
     else:
         print(f'{args.img} not exist!')
 
 
-main()
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The repository root is the package itself, so expose its modules directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
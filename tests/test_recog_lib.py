@@ -0,0 +1,212 @@
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip('Vision')
+
+import Quartz  # noqa: E402
+
+import recog_lib  # noqa: E402
+from recog_lib import TextRecognitionResult, TextRecognizer  # noqa: E402
+
+
+def test_scale_bounding_boxes_flips_y_to_top_left_origin():
+    boxes = [Quartz.CGRectMake(0.25, 0.5, 0.5, 0.25), Quartz.CGRectMake(0, 0, 1, 1)]
+
+    assert recog_lib._scale_bounding_boxes(boxes, (200, 100)) == [
+        (50.0, 50.0, 100.0, 25.0),
+        (0.0, 100.0, 200.0, 100.0),
+    ]
+
+
+def test_scale_bounding_boxes_without_boxes():
+    assert recog_lib._scale_bounding_boxes([], (200, 100)) == []
+
+
+@pytest.mark.parametrize('output_format, expected', [
+    ('text', {'text'}),
+    ('all', {'text', 'coord', 'confidence'}),
+    ('coord+text', {'text', 'coord'}),
+    ('confidence+coord+text', {'text', 'coord', 'confidence'}),
+    (['coord', 'text'], {'text', 'coord'}),
+    (('all',), {'text', 'coord', 'confidence'}),
+])
+def test_parse_output_format(output_format, expected):
+    assert recog_lib._parse_output_format(output_format) == expected
+
+
+@pytest.mark.parametrize('output_format', ['', 'txt', 'text+bogus', 'all+text', [], ['text', 5], None])
+def test_parse_output_format_rejects_unknown_parts(output_format):
+    with pytest.raises(ValueError):
+        recog_lib._parse_output_format(output_format)
+
+
+@pytest.mark.parametrize('region_of_interest', [
+    (0, 0, 1),
+    'whole image',
+    (-0.1, 0, 0.5, 0.5),
+    (0.5, 0, 0.6, 1),
+    (0, 0, 0, 1),
+])
+def test_rejects_invalid_region_of_interest(region_of_interest):
+    with pytest.raises(ValueError, match='Region of interest'):
+        TextRecognizer(default_orientation='up', region_of_interest=region_of_interest)
+
+
+@pytest.mark.parametrize('minimum_text_height', [-0.1, 1.5])
+def test_rejects_minimum_text_height_outside_unit_range(minimum_text_height):
+    with pytest.raises(ValueError, match='Minimum text height'):
+        TextRecognizer(default_orientation='up', minimum_text_height=minimum_text_height)
+
+
+@pytest.mark.parametrize('max_dimension', [0, -1, 1024.0, '2048'])
+def test_rejects_invalid_max_dimension(max_dimension):
+    with pytest.raises(ValueError, match='Max dimension'):
+        TextRecognizer(default_orientation='up', max_dimension=max_dimension)
+
+
+def test_max_dimension_none_keeps_full_resolution():
+    assert TextRecognizer(default_orientation='up', max_dimension=None).max_dimension is None
+
+
+@pytest.fixture
+def ocr_cache(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr(recog_lib, '_OCR_CACHE', cache)
+    monkeypatch.setattr(recog_lib, '_OCR_CACHE_SIZE', 2)
+    return cache
+
+
+def test_cache_evicts_least_recently_used(ocr_cache):
+    first = [TextRecognitionResult('first', None, None)]
+    recog_lib._cache_store(b'first', first)
+    recog_lib._cache_store(b'second', [])
+
+    assert recog_lib._cache_lookup(b'first') == first
+    recog_lib._cache_store(b'third', [])
+
+    assert list(ocr_cache) == [b'first', b'third']
+    assert recog_lib._cache_lookup(b'second') is None
+
+
+def test_cache_lookup_returns_copy(ocr_cache):
+    recog_lib._cache_store(b'key', [TextRecognitionResult('a', None, None)])
+    recog_lib._cache_lookup(b'key').clear()
+
+    assert recog_lib._cache_lookup(b'key') == [TextRecognitionResult('a', None, None)]
+
+
+def test_offset_results_shifts_boxes_only():
+    results = [
+        TextRecognitionResult('a', 0.5, (1.0, 2.0, 3.0, 4.0)),
+        TextRecognitionResult('b', None, None),
+    ]
+
+    assert recog_lib._offset_results(results, 10, 20) == [
+        TextRecognitionResult('a', 0.5, (11.0, 22.0, 3.0, 4.0)),
+        TextRecognitionResult('b', None, None),
+    ]
+
+
+def test_tile_digest_distinguishes_one_bit_tiles():
+    # 1-bit, 16 pixel wide rows: pixels 0-3 set in the first row, 4-7 in the second
+    pixels = np.array([[0xF0, 0x00], [0x0F, 0x00]], dtype=np.uint8)
+
+    digests = {
+        recog_lib._tile_digest(pixels, tile, 1)
+        for tile in [(0, 0, 4, 1), (4, 0, 4, 1), (0, 1, 4, 1), (4, 1, 4, 1), (8, 0, 4, 1)]
+    }
+
+    assert len(digests) == 5
+
+
+def test_tile_digest_matches_recurring_tiles():
+    pixels = np.tile(np.arange(12, dtype=np.uint8), (4, 2))
+
+    assert recog_lib._tile_digest(pixels, (0, 0, 4, 2), 24) == recog_lib._tile_digest(pixels, (4, 2, 4, 2), 24)
+    assert recog_lib._tile_digest(pixels, (0, 0, 4, 2), 24) != recog_lib._tile_digest(pixels, (1, 0, 4, 2), 24)
+
+
+@pytest.fixture
+def disk_caches(monkeypatch):
+    caches = {}
+    monkeypatch.setattr(recog_lib, '_DISK_CACHES', caches)
+    yield caches
+
+    for connection in caches.values():
+        connection.close()
+
+
+def test_disk_cache_round_trip(tmp_path, disk_caches):
+    results = [
+        TextRecognitionResult('a', 0.5, (1.0, 2.0, 3.0, 4.0)),
+        TextRecognitionResult(None, None, None),
+    ]
+    recog_lib._disk_cache_store(str(tmp_path), b'key', results)
+
+    assert recog_lib._disk_cache_lookup(str(tmp_path), b'key') == results
+    assert recog_lib._disk_cache_lookup(str(tmp_path), b'missing') is None
+
+
+def test_disk_cache_ignores_corrupt_rows(tmp_path, disk_caches):
+    recog_lib._disk_cache_store(str(tmp_path), b'key', [])
+    with disk_caches[str(tmp_path)] as connection:
+        connection.execute("UPDATE ocr_results SET results = 'not json'")
+
+    with pytest.warns(RuntimeWarning):
+        assert recog_lib._disk_cache_lookup(str(tmp_path), b'key') is None
+
+
+def test_clear_cache_keeps_disk_results_unless_named(tmp_path, disk_caches):
+    results = [TextRecognitionResult('a', None, None)]
+    recog_lib._disk_cache_store(str(tmp_path), b'key', results)
+
+    TextRecognizer.clear_cache()
+    assert recog_lib._disk_cache_lookup(str(tmp_path), b'key') == results
+
+    TextRecognizer.clear_cache(cache_dir=str(tmp_path))
+    assert recog_lib._disk_cache_lookup(str(tmp_path), b'key') is None
+
+
+def test_clear_cache_does_not_create_a_cache(tmp_path, disk_caches):
+    TextRecognizer.clear_cache(cache_dir=str(tmp_path / 'absent'))
+
+    assert not (tmp_path / 'absent').exists()
+
+
+@pytest.mark.parametrize('path, expected', [
+    ('file:///tmp/scan%20page.png', '/tmp/scan page.png'),
+    ('/tmp/scan page.png', '/tmp/scan page.png'),
+    ('images/scan.png', 'images/scan.png'),
+])
+def test_local_path(path, expected):
+    assert recog_lib._local_path(path) == expected
+
+
+def region_rect(region_of_interest, width, height):
+    return TextRecognizer._region_rect(SimpleNamespace(region_of_interest=region_of_interest), width, height)
+
+
+def test_region_rect_flips_to_top_left_origin():
+    assert region_rect((0.25, 0.5, 0.5, 0.25), 200, 100) == (50, 25, 100, 25)
+
+
+def test_region_rect_whole_image():
+    assert region_rect((0, 0, 1, 1), 640, 480) == (0, 0, 640, 480)
+
+
+def test_region_rect_rounds_outward():
+    assert region_rect((0, 0, 0.5, 0.5), 101, 101) == (0, 50, 51, 51)
+
+
+@pytest.mark.parametrize('value, expected', [(None, 65_536), ('0', 0), (' 4096 ', 4096)])
+def test_cpu_pixel_threshold(value, expected):
+    assert recog_lib._cpu_pixel_threshold(value) == expected
+
+
+@pytest.mark.parametrize('value', ['64k', '', '-1', '1.5'])
+def test_cpu_pixel_threshold_falls_back_on_bad_values(value):
+    with pytest.warns(RuntimeWarning, match='MACOCR_CPU_THRESHOLD'):
+        assert recog_lib._cpu_pixel_threshold(value) == 65_536